@@ -34,11 +34,11 @@ def ensure_action_exists_for_object(
     if not object.animation_data:
         object.animation_data_create()
 
-    action, _ = ensure_object_exists_in_collection(
+    action, is_new = ensure_object_exists_in_collection(
         bpy.data.actions, name or get_name_of_action_for_object(object)
     )
 
-    if clean:
+    if clean and not is_new:
         action.fcurves.clear()
 
     object.animation_data.action = action
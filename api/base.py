@@ -14,7 +14,7 @@ from ssl import create_default_context, CERT_NONE
 from typing import Any, Optional
 from urllib.error import HTTPError
 from urllib.parse import urljoin
-from urllib.request import Request, urlopen
+from urllib.request import HTTPSHandler, OpenerDirector, Request, build_opener
 
 from sbstudio.model.cameras import Camera
 from sbstudio.model.color import Color3D
@@ -139,6 +139,7 @@ class SkybrushStudioAPI:
         
         self._root = None  
         self._request_context = create_default_context()
+        self._opener = None
 
         if api_key and license_file:
             raise SkybrushStudioAPIError(
@@ -217,7 +218,7 @@ class SkybrushStudioAPI:
         req = Request(url, data=data, headers=headers, method=method)
 
         try:
-            with urlopen(req, context=self._request_context) as raw_response:
+            with self._get_opener().open(req) as raw_response:
                 response = Response(raw_response)
                 response._run_sanity_checks()
                 yield response
@@ -261,6 +262,13 @@ class SkybrushStudioAPI:
         ctx.check_hostname = False
         ctx.verify_mode = CERT_NONE
         self._request_context = ctx
+        self._opener = None
+
+    def _get_opener(self) -> OpenerDirector:
+        
+        if self._opener is None:
+            self._opener = build_opener(HTTPSHandler(context=self._request_context))
+        return self._opener
 
     def decompose_points(
         self,
@@ -1,6 +1,8 @@
 
 
-from bpy.types import Action, FCurve
+from bpy.types import Action, FCurve, Keyframe
+from numpy import asarray, float32, zeros
+from numpy.typing import NDArray
 from typing import Callable, Optional, Sequence, Tuple, Union
 
 from .actions import (
@@ -9,7 +11,40 @@ from .actions import (
     get_action_for_object,
 )
 
-__all__ = ("clear_keyframes", "set_keyframes")
+__all__ = ("append_keyframes_to_f_curve", "clear_keyframes", "set_keyframes")
+
+
+def append_keyframes_to_f_curve(
+    fcurve: FCurve,
+    values: Union[Sequence[Tuple[float, float]], NDArray],
+    interpolation: Optional[str] = None,
+) -> list:
+    
+    num_values = len(values)
+    if not num_values:
+        return []
+
+    points = fcurve.keyframe_points
+    num_existing = len(points)
+
+    points.add(num_values)
+
+    co = zeros(2 * (num_existing + num_values), dtype=float32)
+    if num_existing:
+        points.foreach_get("co", co)
+    co[2 * num_existing :] = asarray(values, dtype=float32).ravel()
+    points.foreach_set("co", co)
+
+    if interpolation is not None:
+        codes = [0] * (num_existing + num_values)
+        if num_existing:
+            points.foreach_get("interpolation", codes)
+        codes[num_existing:] = [_get_interpolation_code(interpolation)] * num_values
+        points.foreach_set("interpolation", codes)
+
+    fcurve.update()
+
+    return [points[index] for index in range(num_existing, len(points))]
 
 
 def clear_keyframes(
@@ -141,3 +176,9 @@ def _update_keyframes_on_single_f_curve(
             raise RuntimeError("Cannot set all keyframes")
 
     return result
+
+
+def _get_interpolation_code(interpolation: str) -> int:
+    
+    items = Keyframe.bl_rna.properties["interpolation"].enum_items
+    return items[interpolation].value
@@ -0,0 +1,33 @@
+from numpy import ascontiguousarray, einsum, float64, sqrt
+from numpy.typing import ArrayLike, NDArray
+
+from .jit import HAS_NUMBA, optional_njit
+
+__all__ = ("max_distance_between",)
+
+
+def max_distance_between(first: ArrayLike, second: ArrayLike) -> float:
+    
+    first = ascontiguousarray(first, dtype=float64).reshape(-1, 3)
+    second = ascontiguousarray(second, dtype=float64).reshape(-1, 3)
+    if not len(first):
+        return 0.0
+
+    if HAS_NUMBA:
+        return float(sqrt(_max_distance_sq_between(first, second)))
+
+    diffs = first - second
+    return float(sqrt(einsum("ij,ij->i", diffs, diffs).max()))
+
+
+@optional_njit
+def _max_distance_sq_between(first: NDArray, second: NDArray) -> float:
+    result = 0.0
+    for i in range(first.shape[0]):
+        dx = first[i, 0] - second[i, 0]
+        dy = first[i, 1] - second[i, 1]
+        dz = first[i, 2] - second[i, 2]
+        dist_sq = dx * dx + dy * dy + dz * dz
+        if dist_sq > result:
+            result = dist_sq
+    return result
@@ -0,0 +1,29 @@
+from typing import Callable, TypeVar
+
+__all__ = ("HAS_NUMBA", "optional_njit")
+
+F = TypeVar("F", bound=Callable)
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+HAS_NUMBA: bool = njit is not None
+"""Whether Numba is available to JIT-compile numeric hot loops. Numba is not
+bundled with Blender so callers must provide a fallback implementation when it
+is missing.
+"""
+
+
+def optional_njit(func: F) -> F:
+    
+    if njit is None:
+        return func
+
+    try:
+        return njit(cache=True)(func)
+    except RuntimeError:
+        
+        
+        return njit(func)
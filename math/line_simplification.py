@@ -0,0 +1,109 @@
+from numpy import asarray, bool_, empty, float64, full, int64, zeros
+from numpy.typing import ArrayLike, NDArray
+
+from .jit import HAS_NUMBA, optional_njit
+
+__all__ = ("simplify_timed_values_mask",)
+
+
+def simplify_timed_values_mask(
+    times: ArrayLike, values: ArrayLike, *, eps: float
+) -> NDArray:
+    
+    times = asarray(times, dtype=float64)
+    values = asarray(values, dtype=float64)
+    if values.ndim == 1:
+        values = values.reshape(-1, 1)
+
+    if HAS_NUMBA:
+        return _simplify_timed_values_mask_jit(times, values, float(eps))
+    else:
+        return _simplify_timed_values_mask_numpy(times, values, float(eps))
+
+
+def _simplify_timed_values_mask_numpy(
+    times: NDArray, values: NDArray, eps: float
+) -> NDArray:
+    num_points = len(times)
+    keep = zeros(num_points, dtype=bool)
+    if not num_points:
+        return keep
+
+    keep[0] = keep[-1] = True
+
+    stack = [(0, num_points - 1)]
+    while stack:
+        lo, hi = stack.pop()
+        if hi - lo < 2:
+            continue
+
+        timespan = times[hi] - times[lo]
+        if timespan > 0:
+            ratios = (times[lo + 1 : hi] - times[lo]) / timespan
+        else:
+            ratios = full(hi - lo - 1, 0.5)
+
+        interp = values[lo] + ratios[:, None] * (values[hi] - values[lo])
+        errors = abs(interp - values[lo + 1 : hi]).max(axis=1)
+
+        index = int(errors.argmax())
+        if errors[index] > eps:
+            index += lo + 1
+            keep[index] = True
+            stack.append((lo, index))
+            stack.append((index, hi))
+
+    return keep
+
+
+@optional_njit
+def _simplify_timed_values_mask_jit(
+    times: NDArray, values: NDArray, eps: float
+) -> NDArray:
+    num_points, num_dims = values.shape
+    keep = zeros(num_points, dtype=bool_)
+    if num_points == 0:
+        return keep
+
+    keep[0] = True
+    keep[num_points - 1] = True
+
+    lo_stack = empty(num_points, dtype=int64)
+    hi_stack = empty(num_points, dtype=int64)
+    lo_stack[0] = 0
+    hi_stack[0] = num_points - 1
+    stack_size = 1
+
+    while stack_size > 0:
+        stack_size -= 1
+        lo = lo_stack[stack_size]
+        hi = hi_stack[stack_size]
+        if hi - lo < 2:
+            continue
+
+        timespan = times[hi] - times[lo]
+
+        best_error = -1.0
+        best_index = lo
+        for i in range(lo + 1, hi):
+            ratio = (times[i] - times[lo]) / timespan if timespan > 0 else 0.5
+            error = 0.0
+            for k in range(num_dims):
+                start = values[lo, k]
+                diff = abs(start + ratio * (values[hi, k] - start) - values[i, k])
+                if diff > error:
+                    error = diff
+            if error > best_error:
+                best_error = error
+                best_index = i
+
+        if best_error > eps:
+            keep[best_index] = True
+            lo_stack[stack_size] = lo
+            hi_stack[stack_size] = best_index
+            stack_size += 1
+            lo_stack[stack_size] = best_index
+            hi_stack[stack_size] = hi
+            stack_size += 1
+
+    return keep
@@ -104,7 +104,7 @@ def add_points_to_formation(
         if name_candidate not in existing_names:
             break
 
-    for point in points or []:
+    for point in points if points is not None else ():
         while True:
             marker_name = _get_marker_name(formation_name, index)
             if marker_name in existing_names:
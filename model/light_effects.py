@@ -43,7 +43,7 @@ from sbstudio.plugin.utils import remove_if_unused, with_context
 from sbstudio.plugin.utils.collections import pick_unique_name
 from sbstudio.plugin.utils.color_ramp import update_color_ramp_from
 from sbstudio.plugin.utils.evaluator import get_position_of_object
-from sbstudio.utils import constant, distance_sq_of, load_module, negate
+from sbstudio.utils import constant, distances_sq_of, load_module, negate
 
 from .mixins import ListMixin
 
@@ -434,9 +434,9 @@ class LightEffect(PropertyGroup):
                 if output_type == "DISTANCE":
                     if self.mesh:
                         position_of_mesh = get_position_of_object(self.mesh)
-                        sort_key = lambda index: distance_sq_of(
-                            positions[index], position_of_mesh
-                        )
+                        sort_key = distances_sq_of(
+                            positions, position_of_mesh
+                        ).tolist().__getitem__
                     else:
                         sort_key = None
 
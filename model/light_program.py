@@ -1,6 +1,7 @@
 from operator import attrgetter
 from typing import Optional, Sequence
 
+from sbstudio.math.line_simplification import simplify_timed_values_mask
 from sbstudio.utils import simplify_path
 
 from .color import Color4D
@@ -60,8 +61,19 @@ class LightProgram:
 
     def simplify(self) -> "LightProgram":
         
-        new_items = simplify_path(
-            list(self.colors), eps=4, distance_func=_simplify_color_distance_func
-        )
+        colors = self.colors
+        if len(colors) < 3:
+            
+            
+            new_items = simplify_path(
+                list(colors), eps=4, distance_func=_simplify_color_distance_func
+            )
+        else:
+            keep = simplify_timed_values_mask(
+                [color.t for color in colors],
+                [(color.r, color.g, color.b) for color in colors],
+                eps=4,
+            )
+            new_items = [color for color, kept in zip(colors, keep.tolist()) if kept]
 
         return LightProgram(new_items)
@@ -2,7 +2,6 @@ import csv
 import logging
 
 from dataclasses import dataclass, field
-from functools import partial
 from pathlib import Path
 from typing import Dict, List
 from zipfile import ZipFile
@@ -28,6 +27,9 @@ __all__ = ("AddMarkersFromZippedCSVOperator",)
 
 log = logging.getLogger(__name__)
 
+_FAST_INSERT_OPTIONS = {"FAST"}
+"""Options to pass to ``keyframe_points.insert()`` when importing keyframes"""
+
 
 
 
@@ -123,16 +125,16 @@ class AddMarkersFromZippedCSVOperator(FormationOperator, ImportHelper):
                 f_curves.append(f_curve)
 
             t0 = trajectory.points[0].t
-            insert = [
-                partial(f_curve.keyframe_points.insert, options={"FAST"})
-                for f_curve in f_curves
-            ]
+            insert_x, insert_y, insert_z = (
+                f_curve.keyframe_points.insert for f_curve in f_curves
+            )
+            options = _FAST_INSERT_OPTIONS
             for point in trajectory.points:
                 frame = frame_start + int((point.t - t0) * fps)
                 keyframes = (
-                    insert[0](frame, point.x),
-                    insert[1](frame, point.y),
-                    insert[2](frame, point.z),
+                    insert_x(frame, point.x, options=options),
+                    insert_y(frame, point.y, options=options),
+                    insert_z(frame, point.z, options=options),
                 )
                 for keyframe in keyframes:
                     keyframe.interpolation = "LINEAR"
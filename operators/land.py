@@ -4,6 +4,7 @@ import bpy
 
 from bpy.props import FloatProperty, IntProperty
 from bpy.types import Context
+from numpy import array
 
 from sbstudio.errors import SkybrushStudioError
 from sbstudio.math.nearest_neighbors import find_nearest_neighbors
@@ -138,15 +139,13 @@ class LandOperator(StoryboardOperator):
             delays = [0] * len(source)
             durations = [diff / self.velocity for diff in diffs]
 
-        delays = [int(ceil(delay * fps)) for delay in delays]
-        durations = [int(floor(duration * fps)) for duration in durations]
-        max_duration = max(
-            delay + duration for delay, duration in zip(delays, durations)
+        delays = array([int(ceil(delay * fps)) for delay in delays], dtype=int)
+        durations = array(
+            [int(floor(duration * fps)) for duration in durations], dtype=int
         )
-        post_delays = [
-            max_duration - delay - duration
-            for delay, duration in zip(delays, durations)
-        ]
+        total_durations = delays + durations
+        max_duration = int(total_durations.max())
+        post_delays = max_duration - total_durations
 
         
         
@@ -182,9 +181,11 @@ class LandOperator(StoryboardOperator):
             last_entry = None
 
         
-        if max(delays) > 0 or max(post_delays) > 0:
+        if delays.max() > 0 or post_delays.max() > 0:
             entry.schedule_overrides_enabled = True
-            for index, (delay, post_delay) in enumerate(zip(delays, post_delays)):
+            for index, (delay, post_delay) in enumerate(
+                zip(delays.tolist(), post_delays.tolist())
+            ):
                 if delay > 0 or post_delay > 0:
                     
                     
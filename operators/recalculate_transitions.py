@@ -1,13 +1,17 @@
+import re
+
 from dataclasses import dataclass
 from enum import Enum
-from functools import partial
+from functools import lru_cache
 from math import inf
-from typing import Callable, Iterable, List, Optional, Sequence, Tuple, Union, cast
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple, Union, cast
 
 import bpy
-from bpy.types import Collection, Mesh, MeshVertex, Object
+from bpy.types import Collection, Constraint, Mesh, MeshVertex, Object
 
 from bpy.props import EnumProperty
+from numpy import asarray, float64
+from numpy.typing import NDArray
 
 from sbstudio.api.errors import SkybrushStudioAPIError
 from sbstudio.api.types import Mapping
@@ -15,15 +19,20 @@ from sbstudio.errors import SkybrushStudioError
 from sbstudio.plugin.actions import (
     cleanup_actions_for_object,
     ensure_action_exists_for_object,
+    find_f_curve_for_data_path,
 )
 from sbstudio.plugin.api import get_api
 from sbstudio.plugin.constants import Collections
-from sbstudio.plugin.keyframes import set_keyframes
+from sbstudio.plugin.keyframes import append_keyframes_to_f_curve, clear_keyframes
 from sbstudio.plugin.model.formation import (
     get_markers_and_related_objects_from_formation,
     get_world_coordinates_of_markers_from_formation,
 )
-from sbstudio.plugin.model.storyboard import Storyboard, StoryboardEntry
+from sbstudio.plugin.model.storyboard import (
+    ScheduleOverride,
+    Storyboard,
+    StoryboardEntry,
+)
 from sbstudio.plugin.tasks.safety_check import invalidate_caches
 from sbstudio.plugin.utils import create_internal_id
 from sbstudio.plugin.utils.evaluator import create_position_evaluator
@@ -138,12 +147,15 @@ class InfluenceCurveDescriptor:
             
             
 
-        keyframe_objs = set_keyframes(
-            object,
-            data_path,
-            keyframes,
-            clear_range=(None, inf),
-            interpolation="LINEAR",
+        fcurve = find_f_curve_for_data_path(object, data_path)
+        if fcurve is None:
+            action = ensure_action_exists_for_object(object)
+            fcurve = action.fcurves.new(data_path)
+        else:
+            clear_keyframes(fcurve, keyframes[0][0], inf)
+
+        keyframe_objs = append_keyframes_to_f_curve(
+            fcurve, keyframes, interpolation="LINEAR"
         )
 
         if self.windup_type != InfluenceCurveTransitionType.LINEAR:
@@ -159,28 +171,91 @@ class InfluenceCurveDescriptor:
                 kf.handle_left_type = "AUTO_CLAMPED"
 
 
+MarkersAndObjects = List[Tuple[Union[Object, MeshVertex], Object]]
+"""Type alias for the list of markers and their related objects in a
+formation.
+"""
+
+MarkersAndObjectsCache = Dict[int, MarkersAndObjects]
+"""Type alias for a cache that maps formation pointers to the list of markers
+and related objects in the formation.
+"""
+
+
+def _get_markers_and_related_objects_from_formation_cached(
+    formation: Collection, cache: Optional[MarkersAndObjectsCache]
+) -> MarkersAndObjects:
+    if cache is None:
+        return get_markers_and_related_objects_from_formation(formation)
+
+    key = formation.as_pointer()
+    result = cache.get(key)
+    if result is None:
+        result = cache[key] = get_markers_and_related_objects_from_formation(
+            formation
+        )
+    return result
+
+
 class _LazyFormationTargetList:
     
 
     _formation: Optional[Collection] = None
     """The formation of the storyboard entry."""
 
+    _cache: Optional[MarkersAndObjectsCache] = None
+    """Optional cache of the markers and related objects of formations, shared
+    with other lazy target lists during a single recalculation.
+    """
+
     _items: Optional[List[Union[Object, MeshVertex]]] = None
 
-    def __init__(self, entry: Optional[StoryboardEntry]):
+    _index: Optional[Dict[Union[Object, MeshVertex], int]] = None
+    """Mapping from the items of the formation to their indices in the list of
+    items, constructed lazily.
+    """
+
+    _first_vertices_in_groups: Optional[Dict[int, Dict[int, int]]] = None
+    """Mapping from object pointers to dictionaries that map the indices of
+    the vertex groups of the object to the index of the first vertex with
+    nonzero weight in the group, constructed lazily.
+    """
+
+    def __init__(
+        self,
+        entry: Optional[StoryboardEntry],
+        *,
+        cache: Optional[MarkersAndObjectsCache] = None,
+    ):
         self._formation = entry.formation if entry else None
+        self._cache = cache
 
     def find(self, item, *, default: int = 0) -> int:
         if item is None:
             return default
 
-        if self._items is None:
+        if self._index is None:
             self._items = self._validate_items()
+            self._index = {}
+            for index, target in enumerate(self._items):
+                self._index.setdefault(target, index)
 
-        try:
-            return self._items.index(item)
-        except ValueError:
-            return default
+        return self._index.get(item, default)
+
+    def find_first_vertex_in_group(self, obj: Object, vertex_group) -> Optional[int]:
+        if self._first_vertices_in_groups is None:
+            self._first_vertices_in_groups = {}
+
+        key = obj.as_pointer()
+        first_vertices = self._first_vertices_in_groups.get(key)
+        if first_vertices is None:
+            first_vertices = self._first_vertices_in_groups[key] = {}
+            for vertex in cast(Mesh, obj.data).vertices:
+                for group in vertex.groups:
+                    if group.weight > 0:
+                        first_vertices.setdefault(group.group, vertex.index)
+
+        return first_vertices.get(vertex_group.index)
 
     def _validate_items(self) -> List[Union[Object, MeshVertex]]:
         if self._formation is None:
@@ -188,24 +263,53 @@ class _LazyFormationTargetList:
         else:
             return [
                 v
-                for v, _ in get_markers_and_related_objects_from_formation(
-                    self._formation
+                for v, _ in _get_markers_and_related_objects_from_formation_cached(
+                    self._formation, self._cache
                 )
             ]
 
 
-def get_coordinates_of_formation(formation, *, frame: int) -> List[Tuple[float, ...]]:
+def get_coordinates_of_formation(formation, *, frame: int) -> NDArray[float64]:
     
-    return [
-        tuple(pos)
-        for pos in get_world_coordinates_of_markers_from_formation(
-            formation, frame=frame
-        )
-    ]
+    return asarray(
+        get_world_coordinates_of_markers_from_formation(formation, frame=frame),
+        dtype=float64,
+    )
+
+
+def get_coordinates_of_formations_of_entries(
+    entries: Iterable[StoryboardEntry],
+) -> Dict[str, NDArray[float64]]:
+    
+    items = sorted(
+        ((entry.frame_start, entry.id, entry.formation) for entry in entries),
+        key=lambda item: item[0],
+    )
+    if not items:
+        return {}
+
+    scene = bpy.context.scene
+    current_frame = scene.frame_current
+    result: Dict[str, NDArray[float64]] = {}
+    try:
+        for frame, entry_id, formation in items:
+            scene.frame_set(frame)
+            result[entry_id] = asarray(
+                get_world_coordinates_of_markers_from_formation(formation),
+                dtype=float64,
+            )
+    finally:
+        scene.frame_set(current_frame)
+
+    return result
 
 
 def calculate_mapping_for_transition_into_storyboard_entry(
-    entry: StoryboardEntry, source, *, num_targets: int
+    entry: StoryboardEntry,
+    source,
+    *,
+    num_targets: int,
+    target: Optional[NDArray[float64]] = None,
 ) -> Mapping:
     
     formation = entry.formation
@@ -223,9 +327,12 @@ def calculate_mapping_for_transition_into_storyboard_entry(
     
     if entry.transition_type == "AUTO":
         
-        target = get_coordinates_of_formation(formation, frame=entry.frame_start)
+        if target is None:
+            target = get_coordinates_of_formation(formation, frame=entry.frame_start)
         try:
-            match, clearance = get_api().match_points(source, target, radius=0)
+            match, clearance = get_api().match_points(
+                source, target.tolist(), radius=0
+            )
         except Exception as ex:
             if not isinstance(ex, SkybrushStudioAPIError):
                 raise SkybrushStudioAPIError from ex
@@ -248,21 +355,44 @@ def calculate_mapping_for_transition_into_storyboard_entry(
     return result
 
 
+ConstraintCache = Dict[Tuple[int, str], Optional[Constraint]]
+"""Type alias for a cache that maps pairs of drone pointers and storyboard
+entry IDs to the transition constraint between the drone and the entry.
+"""
+
+
+def _find_transition_constraint_between_cached(
+    drone, entry: StoryboardEntry, cache: Optional[ConstraintCache]
+) -> Optional[Constraint]:
+    if cache is None:
+        return find_transition_constraint_between(drone=drone, storyboard_entry=entry)
+
+    key = drone.as_pointer(), entry.id
+    try:
+        return cache[key]
+    except KeyError:
+        result = cache[key] = find_transition_constraint_between(
+            drone=drone, storyboard_entry=entry
+        )
+        return result
+
+
 def _vertex_index_to_vertex_group_name(index: int) -> str:
     
     return create_internal_id(f"Vertex {index}")
 
 
+_VERTEX_GROUP_NAME_PATTERN = re.compile(r"Skybrush\[Vertex ([0-9]+)\]")
+"""Regular expression that matches the names of the vertex groups created by
+_vertex_index_to_vertex_group_name().
+"""
+
+
+@lru_cache(maxsize=4096)
 def _vertex_group_name_to_vertex_index(name: str) -> Optional[int]:
     
-    if (
-        name.startswith("Skybrush[Vertex ")
-        and name.endswith("]")
-        and name[16:-1].isdigit()
-    ):
-        return int(name[16:-1])
-    else:
-        return None
+    match = _VERTEX_GROUP_NAME_PATTERN.fullmatch(name)
+    return int(match.group(1)) if match else None
 
 
 def calculate_departure_index_of_drone(
@@ -272,6 +402,7 @@ def calculate_departure_index_of_drone(
     previous_entry_index: int,
     previous_mapping: Optional[Mapping],
     targets_in_previous_formation: _LazyFormationTargetList,
+    constraint_cache: Optional[ConstraintCache] = None,
 ) -> int:
     
     
@@ -297,8 +428,8 @@ def calculate_departure_index_of_drone(
         
         return drone_index
 
-    previous_constraint = find_transition_constraint_between(
-        drone=drone, storyboard_entry=previous_entry
+    previous_constraint = _find_transition_constraint_between_cached(
+        drone, previous_entry, constraint_cache
     )
     if previous_constraint is None:
         
@@ -328,36 +459,43 @@ def calculate_departure_index_of_drone(
         
         
         vertex_index = _vertex_group_name_to_vertex_index(previous_constraint.subtarget)
-        previous_mesh = cast(Mesh, previous_obj.data)
-        if vertex_index is not None:
-            previous_target = previous_mesh.vertices[vertex_index]
-        else:
-            for vertex in previous_mesh.vertices:
-                try:
-                    if vertex_group.weight(vertex.index) > 0:
-                        previous_target = vertex
-                        break
-                except Exception:
-                    pass
-            else:
+        if vertex_index is None:
+            vertex_index = targets_in_previous_formation.find_first_vertex_in_group(
+                previous_obj, vertex_group
+            )
+            if vertex_index is None:
                 
                 return 0
 
+        previous_mesh = cast(Mesh, previous_obj.data)
+        previous_target = previous_mesh.vertices[vertex_index]
+
     else:
         previous_target = previous_constraint.target
 
     return targets_in_previous_formation.find(previous_target)
 
 
-def update_transition_constraint_properties(drone, entry: StoryboardEntry, marker, obj):
+def update_transition_constraint_properties(
+    drone,
+    entry: StoryboardEntry,
+    marker,
+    obj,
+    *,
+    constraint_cache: Optional[ConstraintCache] = None,
+):
     
-    constraint = find_transition_constraint_between(drone=drone, storyboard_entry=entry)
+    constraint = _find_transition_constraint_between_cached(
+        drone, entry, constraint_cache
+    )
     if marker is None:
         
         
         
         if constraint is not None:
             drone.constraints.remove(constraint)
+            if constraint_cache is not None:
+                constraint_cache[drone.as_pointer(), entry.id] = None
         return None
 
     
@@ -366,6 +504,8 @@ def update_transition_constraint_properties(drone, entry: StoryboardEntry, marke
         constraint = create_transition_constraint_between(
             drone=drone, storyboard_entry=entry
         )
+        if constraint_cache is not None:
+            constraint_cache[drone.as_pointer(), entry.id] = constraint
     else:
         
         
@@ -376,7 +516,8 @@ def update_transition_constraint_properties(drone, entry: StoryboardEntry, marke
     if marker is obj:
         
         
-        constraint.target = marker
+        if constraint.target != marker:
+            constraint.target = marker
     else:
         
         
@@ -389,32 +530,80 @@ def update_transition_constraint_properties(drone, entry: StoryboardEntry, marke
         except KeyError:
             
             vertex_group = vertex_groups.new(name=vertex_group_name)
+            needs_weight_update = True
+        else:
+            try:
+                needs_weight_update = vertex_group.weight(index) != 1
+            except RuntimeError:
+                
+                needs_weight_update = True
 
         
         
         
         
-        vertex_group.add([index], 1, "REPLACE")
+        if needs_weight_update:
+            vertex_group.add([index], 1, "REPLACE")
 
-        constraint.target = obj
-        constraint.subtarget = vertex_group_name
+        if constraint.target != obj:
+            constraint.target = obj
+        if constraint.subtarget != vertex_group_name:
+            constraint.subtarget = vertex_group_name
 
     return constraint
 
 
+def _get_influence_data_path_of_constraint(constraint: Constraint) -> str:
+    name = constraint.name
+    if '"' in name or "\\" in name:
+        name = name.replace("\\", "\\\\").replace('"', '\\"')
+    return f'constraints["{name}"].influence'
+
+
 def update_transition_constraint_influence(
     drone, constraint, descriptor: InfluenceCurveDescriptor
 ) -> None:
     
-    
-    
-    key = f"constraints[{constraint.name!r}].influence".replace("'", '"')
+    update_transition_constraint_influences([(drone, constraint, descriptor)])
 
+
+def update_transition_constraint_influences(
+    items: Iterable[Tuple[Object, Constraint, InfluenceCurveDescriptor]],
+) -> None:
     
-    ensure_action_exists_for_object(drone)
+    drones_with_action: Set[int] = set()
+
+    for drone, constraint, descriptor in items:
+        
+        
+        
+        key = _get_influence_data_path_of_constraint(constraint)
+
+        
+        drone_key = drone.as_pointer()
+        if drone_key not in drones_with_action:
+            ensure_action_exists_for_object(drone)
+            drones_with_action.add(drone_key)
+
+        
+        descriptor.apply(drone, key)
+
 
+def _get_delays_from_schedule_override_map(
+    schedule_override_map: Dict[int, ScheduleOverride],
+) -> List[Optional[Tuple[int, int]]]:
     
-    descriptor.apply(drone, key)
+    if not schedule_override_map:
+        return []
+
+    result: List[Optional[Tuple[int, int]]] = [None] * (
+        max(schedule_override_map) + 1
+    )
+    for index, override in schedule_override_map.items():
+        if index >= 0:
+            result[index] = override.pre_delay, -override.post_delay
+
+    return result
 
 
 def update_transition_for_storyboard_entry(
@@ -427,6 +616,9 @@ def update_transition_for_storyboard_entry(
     previous_mapping: Optional[Mapping],
     start_of_scene: int,
     start_of_next: Optional[int],
+    markers_cache: Optional[MarkersAndObjectsCache] = None,
+    constraint_cache: Optional[ConstraintCache] = None,
+    target_coordinates: Optional[NDArray[float64]] = None,
 ) -> Optional[Mapping]:
     
     if entry.is_locked:
@@ -438,7 +630,11 @@ def update_transition_for_storyboard_entry(
         
         return None
 
-    markers_and_objects = get_markers_and_related_objects_from_formation(formation)
+    markers_and_objects = _get_markers_and_related_objects_from_formation_cached(
+        formation, markers_cache
+    )
+    markers = [marker for marker, _ in markers_and_objects]
+    objects = [obj for _, obj in markers_and_objects]
     num_markers = len(markers_and_objects)
     end_of_previous = previous_entry.frame_end if previous_entry else start_of_scene
 
@@ -451,9 +647,7 @@ def update_transition_for_storyboard_entry(
     if previous_entry:
         start_points = get_positions_of(drones, frame=end_of_previous)
     else:
-        start_points = get_positions_of(
-            (marker for marker, _ in markers_and_objects), frame=end_of_previous
-        )
+        start_points = get_positions_of(markers, frame=end_of_previous)
         if len(drones) != len(start_points):
             raise SkybrushStudioError(
                 f"First formation has {len(start_points)} markers but the scene "
@@ -465,6 +659,7 @@ def update_transition_for_storyboard_entry(
         entry,
         start_points,
         num_targets=num_markers,
+        target=target_coordinates,
     )
 
     
@@ -477,25 +672,38 @@ def update_transition_for_storyboard_entry(
 
     
     
-    objects_in_formation = _LazyFormationTargetList(entry)
-    objects_in_previous_formation = _LazyFormationTargetList(previous_entry)
+    objects_in_formation = _LazyFormationTargetList(entry, cache=markers_cache)
+    objects_in_previous_formation = _LazyFormationTargetList(
+        previous_entry, cache=markers_cache
+    )
 
     
     
     schedule_override_map = entry.get_enabled_schedule_override_map()
+    schedule_override_delays = _get_delays_from_schedule_override_map(
+        schedule_override_map
+    )
+    num_schedule_override_delays = len(schedule_override_delays)
+
+    is_staggered = entry.is_staggered
+    needs_departure_index = is_staggered or bool(schedule_override_map)
 
     
     
     
-    todo: List[Callable[[], None]] = []
+    pending_influences: List[
+        Tuple[Object, Constraint, InfluenceCurveDescriptor]
+    ] = []
     for drone_index, drone in enumerate(drones):
         target_index = mapping[drone_index]
         if target_index is None:
             marker, obj = None, None
         else:
-            marker, obj = markers_and_objects[target_index]
+            marker, obj = markers[target_index], objects[target_index]
 
-        constraint = update_transition_constraint_properties(drone, entry, marker, obj)
+        constraint = update_transition_constraint_properties(
+            drone, entry, marker, obj, constraint_cache=constraint_cache
+        )
 
         if constraint is not None:
             
@@ -505,19 +713,23 @@ def update_transition_for_storyboard_entry(
             start_frame = entry.frame_start
             departure_delay = 0
             arrival_delay = 0
-            departure_index: Optional[int] = None
-
-            if entry.is_staggered:
-                
-                
-                departure_index = calculate_departure_index_of_drone(
+            departure_index = (
+                calculate_departure_index_of_drone(
                     drone,
                     drone_index,
                     previous_entry,
                     entry_index - 1,
                     previous_mapping,
                     objects_in_previous_formation,
+                    constraint_cache,
                 )
+                if needs_departure_index
+                else 0
+            )
+
+            if is_staggered:
+                
+                
                 arrival_index = objects_in_formation.find(marker)
 
                 departure_delay = entry.pre_delay_per_drone_in_frames * departure_index
@@ -530,20 +742,10 @@ def update_transition_for_storyboard_entry(
                 
                 
                 
-                if departure_index is None:
-                    departure_index = calculate_departure_index_of_drone(
-                        drone,
-                        drone_index,
-                        previous_entry,
-                        entry_index - 1,
-                        previous_mapping,
-                        objects_in_previous_formation,
-                    )
-
-                override = schedule_override_map.get(departure_index)
-                if override:
-                    departure_delay = override.pre_delay
-                    arrival_delay = -override.post_delay
+                if 0 <= departure_index < num_schedule_override_delays:
+                    delays = schedule_override_delays[departure_index]
+                    if delays is not None:
+                        departure_delay, arrival_delay = delays
 
             windup_start_frame += departure_delay
             start_frame += arrival_delay
@@ -574,18 +776,10 @@ def update_transition_for_storyboard_entry(
             
             
             
-            todo.append(
-                partial(
-                    update_transition_constraint_influence,
-                    drone,
-                    constraint,
-                    descriptor,
-                )
-            )
+            pending_influences.append((drone, constraint, descriptor))
 
     
-    for func in todo:
-        func()
+    update_transition_constraint_influences(pending_influences)
 
     return mapping
 
@@ -635,6 +829,17 @@ def recalculate_transitions(
     
     
     previous_mapping: Optional[Mapping] = None
+    markers_cache: MarkersAndObjectsCache = {}
+    constraint_cache: ConstraintCache = {}
+
+    tasks = list(tasks)
+    target_coordinates = get_coordinates_of_formations_of_entries(
+        task.entry
+        for task in tasks
+        if not task.entry.is_locked
+        and task.entry.formation is not None
+        and task.entry.transition_type == "AUTO"
+    )
 
     with create_position_evaluator() as get_positions_of:
         
@@ -649,6 +854,9 @@ def recalculate_transitions(
                 previous_mapping=previous_mapping,
                 start_of_scene=start_of_scene,
                 start_of_next=task.start_frame_of_next_entry,
+                markers_cache=markers_cache,
+                constraint_cache=constraint_cache,
+                target_coordinates=target_coordinates.get(task.entry.id),
             )
 
     
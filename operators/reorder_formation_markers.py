@@ -1,6 +1,16 @@
-from numpy import array, logical_or
-from numpy.linalg import norm
-from natsort import index_natsorted, order_by_index
+from numpy import (
+    arange,
+    array,
+    bool_,
+    einsum,
+    empty,
+    fill_diagonal,
+    logical_or,
+    zeros,
+)
+from numpy.typing import NDArray
+from natsort import index_natsorted
+from itertools import chain
 from random import shuffle
 from typing import List
 
@@ -8,6 +18,7 @@ import bpy
 
 from bpy.props import EnumProperty
 
+from sbstudio.math.jit import HAS_NUMBA, optional_njit
 from sbstudio.plugin.model.safety_check import get_proximity_warning_threshold
 from sbstudio.plugin.utils.collections import sort_collection
 from sbstudio.plugin.utils.evaluator import create_position_evaluator
@@ -71,9 +82,7 @@ class ReorderFormationMarkersOperator(FormationOperator):
 
     def _execute_on_formation_NAME(self, markers, context) -> List[int]:
         
-        names = [str(getattr(marker, "name", "")) for marker in markers]
-        index = index_natsorted(names)
-        return order_by_index(list(range(len(markers))), index)  
+        return index_natsorted([marker.name for marker in markers])
 
     def _execute_on_formation_SHUFFLE(self, markers, context) -> List[int]:
         
@@ -118,14 +127,20 @@ class ReorderFormationMarkersOperator(FormationOperator):
             return []
 
         with create_position_evaluator() as get_positions_of:
-            coords = array(get_positions_of(markers))
+            coords = array(get_positions_of(markers), dtype=float)
+
+        dist_threshold: float = get_proximity_warning_threshold(context)
+        if HAS_NUMBA:
+            return _ensure_safety_distance_sweep(
+                coords, dist_threshold * dist_threshold
+            ).tolist()
 
         queue: List[int] = list(range(num_markers))
-        masked = array([False] * num_markers, dtype=bool)
+        masked = zeros(num_markers, dtype=bool)
         skipped: List[int] = []
         result: List[int] = []
 
-        dist_threshold: float = get_proximity_warning_threshold(context)
+        close = _get_proximity_matrix(coords, dist_threshold)
 
         while queue:
             
@@ -139,11 +154,7 @@ class ReorderFormationMarkersOperator(FormationOperator):
                 else:
                     
                     
-                    closer = (
-                        norm(coords - coords[marker_index], axis=1) < dist_threshold
-                    )
-                    closer[marker_index] = False
-                    logical_or(masked, closer, out=masked)
+                    logical_or(masked, close[marker_index], out=masked)
                     result.append(marker_index)
 
             queue.clear()
@@ -156,13 +167,13 @@ class ReorderFormationMarkersOperator(FormationOperator):
     @staticmethod
     def _sort_by_axis(markers, *, axis: int) -> List[int]:
         
-        with create_position_evaluator() as get_positions_of:
-            coords = get_positions_of(markers)
+        if not len(markers):
+            return []
 
-        def key_func(x: int):
-            return coords[x][axis]
+        with create_position_evaluator() as get_positions_of:
+            coords = array(get_positions_of(markers), dtype=float)
 
-        return sorted(range(len(markers)), key=key_func)
+        return coords[:, axis].argsort(kind="stable").tolist()
 
     @staticmethod
     def _sweep(markers, *, step: int) -> List[int]:
@@ -171,6 +182,70 @@ class ReorderFormationMarkersOperator(FormationOperator):
         if not num_markers or step < 2:
             return markers
         else:
-            return sum(
-                (list(range(start, num_markers, step)) for start in range(step)), []
+            return list(
+                chain.from_iterable(
+                    range(start, num_markers, step) for start in range(step)
+                )
             )
+
+
+_PROXIMITY_MATRIX_BLOCK_SIZE = 256
+"""Number of rows of the proximity matrix to compute in a single step. Limits
+the size of the temporary coordinate difference array.
+"""
+
+
+def _get_proximity_matrix(coords: NDArray, threshold: float) -> NDArray:
+    num_points = len(coords)
+    result = zeros((num_points, num_points), dtype=bool)
+    threshold_sq = threshold * threshold
+
+    for start in range(0, num_points, _PROXIMITY_MATRIX_BLOCK_SIZE):
+        end = min(start + _PROXIMITY_MATRIX_BLOCK_SIZE, num_points)
+        diffs = coords[start:end, None, :] - coords[None, :, :]
+        result[start:end] = einsum("ijk,ijk->ij", diffs, diffs) < threshold_sq
+
+    fill_diagonal(result, False)
+    return result
+
+
+@optional_njit
+def _ensure_safety_distance_sweep(coords: NDArray, threshold_sq: float) -> NDArray:
+    num_points, num_dims = coords.shape
+    queue = arange(num_points)
+    skipped = empty(num_points, dtype=queue.dtype)
+    result = empty(num_points, dtype=queue.dtype)
+    masked = zeros(num_points, dtype=bool_)
+
+    num_queued = num_points
+    num_results = 0
+    while num_queued > 0:
+        masked[:] = False
+        num_skipped = 0
+
+        for k in range(num_queued):
+            i = queue[k]
+            if masked[i]:
+                skipped[num_skipped] = i
+                num_skipped += 1
+                continue
+
+            result[num_results] = i
+            num_results += 1
+
+            for j in range(num_points):
+                if j == i or masked[j]:
+                    continue
+
+                dist_sq = 0.0
+                for dim in range(num_dims):
+                    diff = coords[j, dim] - coords[i, dim]
+                    dist_sq += diff * diff
+
+                if dist_sq < threshold_sq:
+                    masked[j] = True
+
+        queue[:num_skipped] = skipped[:num_skipped]
+        num_queued = num_skipped
+
+    return result
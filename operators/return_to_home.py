@@ -4,10 +4,11 @@ import bpy
 
 from bpy.props import FloatProperty, IntProperty, BoolProperty
 from bpy.types import Context
-from functools import partial
-from math import ceil, sqrt
+from math import ceil
+from numpy import append, asarray, empty, float64
 
 from sbstudio.errors import SkybrushStudioError
+from sbstudio.math.distances import max_distance_between
 from sbstudio.model.types import Coordinate3D
 from sbstudio.plugin.api import call_api_from_blender_operator
 from sbstudio.plugin.constants import Collections
@@ -15,6 +16,7 @@ from sbstudio.plugin.actions import (
     ensure_action_exists_for_object,
     find_f_curve_for_data_path_and_index,
 )
+from sbstudio.plugin.keyframes import append_keyframes_to_f_curve, clear_keyframes
 from sbstudio.plugin.model.formation import create_formation, get_markers_from_formation
 from sbstudio.plugin.model.safety_check import get_proximity_warning_threshold
 from sbstudio.plugin.model.storyboard import (
@@ -168,18 +170,18 @@ class ReturnToHomeOperator(StoryboardOperator):
             1 if use_smart_rth else 0
         )
 
+        first_frame = storyboard.frame_start
         with create_position_evaluator() as get_positions_of:
             source = get_positions_of(drones, frame=self.start_frame)
-
-        first_frame = storyboard.frame_start
-        _, target, _ = create_helper_formation_for_takeoff_and_landing(
-            drones,
-            frame=first_frame,
-            base_altitude=self.altitude,
-            layer_height=self.altitude_shift if not use_smart_rth else 0,
-            min_distance=get_proximity_warning_threshold(context),
-            operator=self,
-        )
+            _, target, _ = create_helper_formation_for_takeoff_and_landing(
+                drones,
+                frame=first_frame,
+                base_altitude=self.altitude,
+                layer_height=self.altitude_shift if not use_smart_rth else 0,
+                min_distance=get_proximity_warning_threshold(context),
+                operator=self,
+                get_positions_of=get_positions_of,
+            )
 
         run_rth = self._run_smart_rth if use_smart_rth else self._run_base_rth
         result = run_rth(storyboard, source=source, target=target, context=context)
@@ -197,14 +199,9 @@ class ReturnToHomeOperator(StoryboardOperator):
         context: Context,
     ) -> bool:
         fps = context.scene.render.fps
-        diffs = [
-            sqrt((s[0] - t[0]) ** 2 + (s[1] - t[1]) ** 2 + (s[2] - t[2]) ** 2)
-            for s, t in zip(source, target)
-        ]
-
         
         
-        max_distance = max(diffs)
+        max_distance = max_distance_between(source, target)
         rth_duration = ceil((max_distance / self.velocity) * fps)
 
         
@@ -241,12 +238,14 @@ class ReturnToHomeOperator(StoryboardOperator):
         max_acceleration = settings.max_acceleration if settings else 4
         min_distance = get_proximity_warning_threshold(context)
         land_speed = min(self.velocity_z, 0.5)
+        landing_time = self.altitude / land_speed
+        start_frame = self.start_frame
 
         
         with call_api_from_blender_operator(self) as api:
             plan = api.plan_smart_rth(
                 source,
-                target,
+                asarray(target).tolist(),
                 max_velocity_xy=self.velocity,
                 max_velocity_z=self.velocity_z,
                 max_acceleration=max_acceleration,
@@ -261,8 +260,8 @@ class ReturnToHomeOperator(StoryboardOperator):
         
         entry = storyboard.add_new_entry(
             formation=create_formation("Smart return to home", source),
-            frame_start=self.start_frame,
-            duration=int(ceil((plan.duration + self.altitude / land_speed) * fps)),
+            frame_start=start_frame,
+            duration=int(ceil((plan.duration + landing_time) * fps)),
             select=True,
             purpose=StoryboardEntryPurpose.LANDING,
             context=context,
@@ -280,13 +279,22 @@ class ReturnToHomeOperator(StoryboardOperator):
             markers,
             strict=True,
         ):
+            marker_name = marker.name
             action = ensure_action_exists_for_object(
-                marker, name=f"Animation data for {marker.name}", clean=True
+                marker, name=f"Animation data for {marker_name}", clean=True
             )
 
+            
+            
+            
+            has_f_curves = len(action.fcurves) > 0
             f_curves = []
             for i in range(3):
-                f_curve = find_f_curve_for_data_path_and_index(action, "location", i)
+                f_curve = (
+                    find_f_curve_for_data_path_and_index(action, "location", i)
+                    if has_f_curves
+                    else None
+                )
                 if f_curve is None:
                     f_curve = action.fcurves.new("location", index=i)
                 else:
@@ -294,41 +302,39 @@ class ReturnToHomeOperator(StoryboardOperator):
                     
                     
                     
-                    print(f"Already existing F-curve! {marker.name} {i}")
+                    print(f"Already existing F-curve! {marker_name} {i}")
                     pass
                 f_curves.append(f_curve)
-            insert = [
-                partial(f_curve.keyframe_points.insert, options={"FAST"})
-                for f_curve in f_curves
-            ]
-            path_points = []
-            if start_time > 0:
-                path_points.append((0, *p))
-            path_points.append((start_time, *p))
-            path_points.extend(tuple(inner_points))
-            path_points.extend(
-                (
-                    (start_time + duration, *q),
-                    (
-                        start_time + duration + self.altitude / land_speed,
-                        q[0],
-                        q[1],
-                        0,  
-                    ),
-                )
+            num_inner_points = len(inner_points)
+            offset = 1 if start_time > 0 else 0
+            path_points = empty((offset + num_inner_points + 3, 4), dtype=float64)
+            if offset:
+                path_points[0] = (0, *p)
+            path_points[offset] = (start_time, *p)
+            if num_inner_points:
+                path_points[offset + 1 : -2] = inner_points
+            path_points[-2] = (start_time + duration, *q)
+            path_points[-1] = (
+                start_time + duration + landing_time,
+                q[0],
+                q[1],
+                0,
             )
-            for point in path_points:
-                frame = int(self.start_frame + point[0] * fps)
-                keyframes = (
-                    insert[0](frame, point[1]),
-                    insert[1](frame, point[2]),
-                    insert[2](frame, point[3]),
-                )
-                for keyframe in keyframes:
-                    keyframe.interpolation = "LINEAR"
+
+            frames = (start_frame + path_points[:, 0] * fps).astype(int)
+            is_last_on_frame = append(frames[1:] != frames[:-1], True)
+            frames = frames[is_last_on_frame]
+            path_points = path_points[is_last_on_frame]
+
+            
             
-            for f_curve in f_curves:
-                f_curve.update()
+            keyframes = empty((len(frames), 2), dtype=float64)
+            keyframes[:, 0] = frames
+            for i, f_curve in enumerate(f_curves):
+                if len(f_curve.keyframe_points):
+                    clear_keyframes(f_curve, frames[0], frames[-1])
+                keyframes[:, 1] = path_points[:, i + 1]
+                append_keyframes_to_f_curve(f_curve, keyframes, interpolation="LINEAR")
 
         return True
 
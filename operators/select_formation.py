@@ -1,8 +1,11 @@
 from bpy.types import MeshVertex
 
 from sbstudio.plugin.model.formation import get_markers_from_formation
-from sbstudio.plugin.plugin_helpers import enter_edit_mode, temporarily_exit_edit_mode
-from sbstudio.plugin.objects import object_contains_vertex
+from sbstudio.plugin.plugin_helpers import (
+    enter_edit_mode,
+    exit_edit_mode,
+    temporarily_exit_edit_mode,
+)
 from sbstudio.plugin.selection import (
     add_to_selection,
     ensure_vertex_select_mode_enabled,
@@ -25,26 +28,38 @@ class SelectFormationOperator(FormationOperator):
         
         
         
-        with temporarily_exit_edit_mode():
+        
+        
+        
+        
+        
+        edit_mode_object = exit_edit_mode(context=context)
+        vertex_select_mode = False
+
+        try:
             markers = get_markers_from_formation(formation)
             add_to_selection(markers, context=context)
 
-        if all(isinstance(marker, MeshVertex) for marker in markers):
-            
-            
-            objects_of_markers = [
-                obj
-                for obj in formation.objects
-                if any(object_contains_vertex(obj, marker) for marker in markers)
-            ]
-            if len(objects_of_markers) == 1:
-                enter_edit_mode(objects_of_markers[0], context=context)
-                ensure_vertex_select_mode_enabled(context=context)
-            else:
-                self.report(
-                    {"ERROR"},
-                    "This formation consists of multiple objects; cannot select one for Edit mode",
-                )
+            if markers and all(isinstance(marker, MeshVertex) for marker in markers):
+                
+                
+                meshes_of_markers = {marker.id_data for marker in markers}
+                objects_of_markers = [
+                    obj for obj in formation.objects if obj.data in meshes_of_markers
+                ]
+                if len(objects_of_markers) == 1:
+                    edit_mode_object = objects_of_markers[0]
+                    vertex_select_mode = True
+                else:
+                    self.report(
+                        {"ERROR"},
+                        "This formation consists of multiple objects; cannot select one for Edit mode",
+                    )
+        finally:
+            if edit_mode_object is not None:
+                enter_edit_mode(edit_mode_object, context=context)
+                if vertex_select_mode:
+                    ensure_vertex_select_mode_enabled(context=context)
 
         return {"FINISHED"}
 
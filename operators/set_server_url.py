@@ -6,6 +6,25 @@ from bpy.types import Operator
 __all__ = ("SetServerURLOperator",)
 
 
+SAVE_DELAY = 2.0
+"""Number of seconds to wait after the last server URL change before saving
+the user preferences and refreshing the list of supported file formats.
+"""
+
+
+def _save_preferences_and_refresh_file_formats() -> None:
+    
+    bpy.ops.wm.save_userpref()
+
+    try:
+        bpy.ops.skybrush.refresh_file_formats()
+    except RuntimeError:
+        
+        pass
+
+    return None
+
+
 class SetServerURLOperator(Operator):
     
 
@@ -21,12 +40,11 @@ class SetServerURLOperator(Operator):
         prefs = get_preferences()
         prefs.server_url = self.url
 
-        bpy.ops.wm.save_userpref()
-
-        try:
-            bpy.ops.skybrush.refresh_file_formats()
-        except RuntimeError:
-            
-            pass
+        timers = bpy.app.timers
+        if timers.is_registered(_save_preferences_and_refresh_file_formats):
+            timers.unregister(_save_preferences_and_refresh_file_formats)
+        timers.register(
+            _save_preferences_and_refresh_file_formats, first_interval=SAVE_DELAY
+        )
 
         return {"FINISHED"}
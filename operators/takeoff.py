@@ -2,7 +2,9 @@ import bpy
 
 from bpy.props import BoolProperty, FloatProperty, IntProperty
 from bpy.types import Context
-from math import ceil, inf
+from math import inf
+from typing import Callable, Optional
+from numpy import array, asarray, ceil, flatnonzero, float64
 
 from sbstudio.errors import SkybrushStudioError
 from sbstudio.math.nearest_neighbors import find_nearest_neighbors
@@ -132,9 +134,12 @@ class TakeoffOperator(StoryboardOperator):
         )
 
         
-        diffs = [t[2] - s[2] for s, t in zip(source, target)]
-        if min(diffs) < 0:
-            dist = abs(min(diffs))
+        diffs = (
+            asarray(target, dtype=float64)[:, 2] - asarray(source, dtype=float64)[:, 2]
+        )
+        min_diff = float(diffs.min())
+        if min_diff < 0:
+            dist = abs(min_diff)
             self.report(
                 {"ERROR"},
                 f"At least one drone would have to take off downwards by {dist}m",
@@ -144,12 +149,12 @@ class TakeoffOperator(StoryboardOperator):
         
         
         fps = context.scene.render.fps
-        takeoff_durations = [ceil((diff / self.velocity) * fps) for diff in diffs]
+        takeoff_durations = ceil((diffs / self.velocity) * fps).astype(int)
 
         
         
-        takeoff_duration = max(takeoff_durations)
-        delays = [takeoff_duration - d for d in takeoff_durations]
+        takeoff_duration = int(takeoff_durations.max())
+        delays = takeoff_duration - takeoff_durations
 
         
         end_of_takeoff = self.start_frame + takeoff_duration
@@ -203,13 +208,13 @@ class TakeoffOperator(StoryboardOperator):
         entry.transition_type = "MANUAL"
 
         
-        if delays and max(delays) > 0:
+        delayed_indices = flatnonzero(delays > 0)
+        if delayed_indices.size:
             entry.schedule_overrides_enabled = True
-            for index, delay in enumerate(delays):
-                if delay > 0:
-                    override = entry.add_new_schedule_override()
-                    override.index = index
-                    override.pre_delay = delay
+            for index in delayed_indices.tolist():
+                override = entry.add_new_schedule_override()
+                override.index = index
+                override.pre_delay = int(delays[index])
 
         
         
@@ -281,10 +286,14 @@ def create_helper_formation_for_takeoff_and_landing(
     layer_height: float,
     min_distance: float,
     operator=None,
+    get_positions_of: Optional[Callable] = None,
 ):
     
     
-    with create_position_evaluator() as get_positions_of:
+    if get_positions_of is None:
+        with create_position_evaluator() as get_positions_of:
+            source = get_positions_of(drones, frame=frame)
+    else:
         source = get_positions_of(drones, frame=frame)
 
     
@@ -303,13 +312,16 @@ def create_helper_formation_for_takeoff_and_landing(
     else:
         
         groups = [0] * len(source)
+        target = array(source, dtype=float64).reshape(-1, 3)
+        target[:, 2] = base_altitude
+        return source, target, groups
 
     num_groups = max(groups) + 1 if groups else 0
 
     
-    target = [
-        (x, y, base_altitude + (num_groups - group - 1) * layer_height)
-        for (x, y, _), group in zip(source, groups)
-    ]
+    target = array(source, dtype=float64).reshape(-1, 3)
+    target[:, 2] = base_altitude + (
+        num_groups - asarray(groups, dtype=float64) - 1
+    ) * layer_height
 
     return source, target, groups
@@ -1,6 +1,7 @@
 from bpy.props import EnumProperty
 from bpy.types import Context, Scene
 from mathutils import Vector
+from numpy import array, c_, float64, ones
 
 from sbstudio.plugin.constants import Collections
 from sbstudio.plugin.model.formation import (
@@ -69,33 +70,59 @@ def propose_mode_for_formation_update(context) -> str:
         return "SELECTED_OBJECTS" if has_selection(context=context) else "EMPTY"
 
 
+def _collect_nothing():
+    return [], {}
+
+
+def _collect_positions_of_all_drones():
+    return [], {obj: [Vector()] for obj in Collections.find_drones().objects}
+
+
+def _collect_selected_objects():
+    return list(get_selected_objects()), {}
+
+
+def _collect_positions_of_selected_objects():
+    return [], {obj: [Vector()] for obj in get_selected_objects()}
+
+
+def _collect_positions_of_selected_vertices():
+    return [], {
+        obj: [point.co for point in points]
+        for obj, points in get_selected_vertices_grouped_by_objects().items()
+    }
+
+
+_COLLECTORS = {
+    "EMPTY": _collect_nothing,
+    "ALL_DRONES": _collect_positions_of_all_drones,
+    "SELECTED_OBJECTS": _collect_selected_objects,
+    "POSITIONS_OF_SELECTED_OBJECTS": _collect_positions_of_selected_objects,
+    "POSITIONS_OF_SELECTED_VERTICES": _collect_positions_of_selected_vertices,
+}
+"""Functions that collect the objects to add to a formation and the points
+to create markers for, keyed by the supported formation update modes.
+"""
+
+
 def collect_objects_and_points_for_formation_update(selection, name):
     
-    objects = []
-    points_in_local_coords = {}
-
-    if selection == "EMPTY":
-        pass
-    elif selection == "ALL_DRONES":
-        points_in_local_coords = {
-            obj: [Vector()] for obj in Collections.find_drones().objects
-        }
-    elif selection == "SELECTED_OBJECTS":
-        objects.extend(get_selected_objects())
-    elif selection == "POSITIONS_OF_SELECTED_OBJECTS":
-        points_in_local_coords = {obj: [Vector()] for obj in get_selected_objects()}
-    elif selection == "POSITIONS_OF_SELECTED_VERTICES":
-        points_in_local_coords = {
-            obj: [point.co for point in points]
-            for obj, points in get_selected_vertices_grouped_by_objects().items()
-        }
-    else:
-        raise ValueError("Unknown selection: {}".format(selection))
+    try:
+        collector = _COLLECTORS[selection]
+    except KeyError:
+        raise ValueError(f"Unknown selection: {selection}") from None
+
+    objects, points_in_local_coords = collector()
 
     points = []
     for parent, points_of_parent in points_in_local_coords.items():
-        local_to_world = parent.matrix_world
-        points.extend(local_to_world @ point for point in points_of_parent)
+        num_points = len(points_of_parent)
+        if not num_points:
+            continue
+
+        local_to_world = array(parent.matrix_world, dtype=float64)
+        coords = c_[array(points_of_parent, dtype=float64), ones(num_points)]
+        points.extend((coords @ local_to_world.T)[:, :3].tolist())
 
     return objects, points
 
@@ -117,7 +144,7 @@ class UpdateFormationOperator(FormationOperator):
         return context.window_manager.invoke_props_dialog(self)
 
     def execute_on_formation(self, formation, context):
-        objects_in_formation = formation.objects
+        objects_in_formation = list(formation.objects)
 
         new_objects, new_points = collect_objects_and_points_for_formation_update(
             self.update_with, formation.name
@@ -127,8 +154,9 @@ class UpdateFormationOperator(FormationOperator):
         
         
         
-        to_unlink = {obj for obj in objects_in_formation if obj.users > 1}
-        to_delete = set(objects_in_formation) - to_unlink - set(new_objects)
+        to_unlink = [obj for obj in objects_in_formation if obj.users > 1]
+        to_keep = frozenset(to_unlink).union(new_objects)
+        to_delete = [obj for obj in objects_in_formation if obj not in to_keep]
 
         
         for obj in to_unlink:
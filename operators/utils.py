@@ -2,14 +2,11 @@
 
 import logging
 
-from bpy.path import basename
 from bpy.types import Context
 
-from itertools import groupby
-from natsort import natsorted
-from operator import attrgetter
+from natsort import index_natsorted
 from pathlib import Path
-from typing import Any, Optional, cast
+from typing import Any, Callable, Optional, cast
 
 from sbstudio.api.base import SkybrushStudioAPI
 from sbstudio.model.light_program import LightProgram
@@ -38,13 +35,18 @@ from sbstudio.plugin.utils.sampling import (
     sample_positions_colors_and_yaw_of_objects,
 )
 from sbstudio.plugin.utils.time_markers import get_time_markers_from_context
-from sbstudio.utils import get_ends
+from sbstudio.utils import LRUCache
 
 __all__ = ("get_drones_to_export", "export_show_to_file_using_api")
 
 
 log = logging.getLogger(__name__)
 
+_drone_order_cache: LRUCache[tuple[str, ...], list[int]] = LRUCache(4)
+"""Cache that maps tuples of drone names to the indices of the drones in
+natural sort order so repeated exports do not have to sort them again.
+"""
+
 
 class _default_settings:
     output_fps = 4
@@ -67,7 +69,15 @@ def get_drones_to_export(selected_only: bool = False):
         if not selected_only or drone.select_get()
     ]
 
-    return natsorted(to_export, key=attrgetter("name"))
+    
+    
+    names = tuple(drone.name for drone in to_export)
+    try:
+        order = _drone_order_cache.get(names)
+    except KeyError:
+        order = _drone_order_cache[names] = index_natsorted(names)
+
+    return [to_export[index] for index in order]
 
 
 @with_context
@@ -85,39 +95,47 @@ def _get_segments(context: Optional[Context] = None) -> dict[str, tuple[float, f
     storyboard = get_storyboard(context=context)
     fps = context.scene.render.fps
 
-    entry_purpose_groups = groupby(storyboard.entries, lambda e: cast(str, e.purpose))
-
-    takeoff_entries: list[StoryboardEntry] | None = None
-    show_entries: list[StoryboardEntry] | None = None
-    landing_entries: list[StoryboardEntry] | None = None
-    show_valid = True
-    for purpose, entries in entry_purpose_groups:
-        if purpose == StoryboardEntryPurpose.TAKEOFF.name:
-            if not (show_entries is None and landing_entries is None):
-                show_valid = False
-                break
-
-            takeoff_entries = list(entries)
-        elif purpose == StoryboardEntryPurpose.SHOW.name:
-            if landing_entries is not None:
-                show_valid = False
-                break
-
-            show_entries = list(entries)
-        elif purpose == StoryboardEntryPurpose.LANDING.name:
-            landing_entries = list(entries)
-
-    if show_valid:
-        if ends := get_ends(takeoff_entries):
-            result["takeoff"] = (ends[0].frame_start / fps, ends[1].frame_end / fps)
-        if ends := get_ends(show_entries):
-            result["show"] = (ends[0].frame_start / fps, ends[1].frame_end / fps)
-        if ends := get_ends(landing_entries):
-            result["landing"] = (ends[0].frame_start / fps, ends[1].frame_end / fps)
+    
+    
+    
+    
+    ends: dict[StoryboardEntryPurpose, list[StoryboardEntry]] = {}
+    previous_order = 0
+    for entry in storyboard.entries:
+        purpose = StoryboardEntryPurpose[cast(str, entry.purpose)]
+        if purpose.order < previous_order:
+            return result
+
+        previous_order = purpose.order
+        ends_of_purpose = ends.get(purpose)
+        if ends_of_purpose is None:
+            ends[purpose] = [entry, entry]
+        else:
+            ends_of_purpose[1] = entry
+
+    for purpose, (first, last) in ends.items():
+        result[purpose.name.lower()] = (first.frame_start / fps, last.frame_end / fps)
 
     return result
 
 
+def _simplify_light_program(
+    light_program: LightProgram, cache: dict[tuple, LightProgram]
+) -> LightProgram:
+    
+    signature = tuple(
+        (color.t, color.r, color.g, color.b, color.is_fade)
+        for color in light_program.colors
+    )
+    simplified = cache.get(signature)
+    if simplified is None:
+        simplified = cache[signature] = light_program.simplify()
+
+    
+    
+    return LightProgram(simplified.colors)
+
+
 @with_context
 def _get_trajectories_and_lights(
     drones,
@@ -146,10 +164,13 @@ def _get_trajectories_and_lights(
 
         trajectories = {}
         lights = {}
+        simplified_light_programs: dict[tuple, LightProgram] = {}
 
         for key, (trajectory, light_program) in result.items():
             trajectories[key] = trajectory
-            lights[key] = light_program.simplify()
+            lights[key] = _simplify_light_program(
+                light_program, simplified_light_programs
+            )
 
     else:
         
@@ -207,11 +228,14 @@ def _get_trajectories_lights_and_yaw_setpoints(
         trajectories = {}
         lights = {}
         yaw_setpoints = {}
+        simplified_light_programs: dict[tuple, LightProgram] = {}
 
         for key, (trajectory, light_program, yaw_curve) in result.items():
             trajectories[key] = trajectory
             
-            lights[key] = light_program.simplify()
+            lights[key] = _simplify_light_program(
+                light_program, simplified_light_programs
+            )
             yaw_setpoints[key] = yaw_curve
 
     else:
@@ -247,6 +271,49 @@ def _get_trajectories_lights_and_yaw_setpoints(
     return trajectories, lights, yaw_setpoints
 
 
+def _no_renderer_params(fps: int, light_fps: int) -> dict[str, Any]:
+    return {}
+
+
+def _dac_renderer_params(fps: int, light_fps: int) -> dict[str, Any]:
+    return {"show_id": 1555, "title": "Skybrush show"}
+
+
+def _fps_renderer_params(fps: int, light_fps: int) -> dict[str, Any]:
+    return {"fps": fps}
+
+
+def _fps_and_light_fps_renderer_params(fps: int, light_fps: int) -> dict[str, Any]:
+    return {"fps": fps, "light_fps": light_fps}
+
+
+_RENDERERS: dict[
+    FileFormat, tuple[str, str, Callable[[int, int], dict[str, Any]]]
+] = {
+    FileFormat.SKYC: (".skyc", "skyc", _no_renderer_params),
+    FileFormat.CSV: ("CSV", "csv", _fps_renderer_params),
+    FileFormat.DAC: (".dac format", "dac", _dac_renderer_params),
+    FileFormat.DROTEK: ("Drotek format", "drotek", _fps_renderer_params),
+    FileFormat.DSS: ("DSS PATH format", "dss", _no_renderer_params),
+    FileFormat.DSS3: (
+        "DSS PATH3 format",
+        "dss3",
+        _fps_and_light_fps_renderer_params,
+    ),
+    FileFormat.EVSKY: ("EVSKY format", "evsky", _fps_and_light_fps_renderer_params),
+    FileFormat.LITEBEE: ("Litebee format", "litebee", _no_renderer_params),
+    FileFormat.VVIZ: (
+        "Finale 3D .vviz format",
+        "vviz",
+        _fps_and_light_fps_renderer_params,
+    ),
+}
+"""Human-readable description, renderer name and renderer parameter factory
+for each file format that is exported through the show renderers of the
+server. The factories receive the trajectory and light output frame rates.
+"""
+
+
 def export_show_to_file_using_api(
     api: SkybrushStudioAPI,
     context: Context,
@@ -299,7 +366,7 @@ def export_show_to_file_using_api(
         yaw_setpoints = None
 
     
-    show_title = str(basename(filepath).split(".")[0])
+    show_title = Path(filepath).name.partition(".")[0]
 
     
     scene_settings = getattr(context.scene.skybrush, "settings", None)
@@ -337,77 +404,31 @@ def export_show_to_file_using_api(
     
     show_segments = _get_segments(context=context)
 
-    renderer_params = {}
+    output_fps = settings.get("output_fps", _default_settings.output_fps)
+    light_output_fps = settings.get(
+        "light_output_fps", _default_settings.light_output_fps
+    )
 
     
     if format is FileFormat.PDF:
         log.info("Exporting validation plots to .pdf")
         plots = settings.get("plots", ["pos", "vel", "drift", "nn"])
-        fps = settings.get("output_fps", _default_settings.output_fps)
         api.generate_plots(
             trajectories=trajectories,
             output=filepath,
             validation=validation,
             plots=plots,
-            fps=fps,
+            fps=output_fps,
             time_markers=time_markers,
         )
     else:
-        if format is FileFormat.SKYC:
-            log.info("Exporting show to .skyc")
-            renderer = "skyc"
-        elif format is FileFormat.CSV:
-            log.info("Exporting show to CSV")
-            renderer = "csv"
-            renderer_params = {**renderer_params, "fps": settings["output_fps"]}
-        elif format is FileFormat.DAC:
-            log.info("Exporting show to .dac format")
-            renderer = "dac"
-            renderer_params = {
-                **renderer_params,
-                "show_id": 1555,
-                "title": "Skybrush show",
-            }
-        elif format is FileFormat.DROTEK:
-            log.info("Exporting show to Drotek format")
-            renderer = "drotek"
-            renderer_params = {
-                **renderer_params,
-                "fps": settings["output_fps"],
-                
-            }
-        elif format is FileFormat.DSS:
-            log.info("Exporting show to DSS PATH format")
-            renderer = "dss"
-        elif format is FileFormat.DSS3:
-            log.info("Exporting show to DSS PATH3 format")
-            renderer = "dss3"
-            renderer_params = {
-                **renderer_params,
-                "fps": settings["output_fps"],
-                "light_fps": settings["light_output_fps"],
-            }
-        elif format is FileFormat.EVSKY:
-            log.info("Exporting show to EVSKY format")
-            renderer = "evsky"
-            renderer_params = {
-                **renderer_params,
-                "fps": settings["output_fps"],
-                "light_fps": settings["light_output_fps"],
-            }
-        elif format is FileFormat.LITEBEE:
-            log.info("Exporting show to Litebee format")
-            renderer = "litebee"
-        elif format is FileFormat.VVIZ:
-            log.info("Exporting show to Finale 3D .vviz format")
-            renderer = "vviz"
-            renderer_params = {
-                **renderer_params,
-                "fps": settings["output_fps"],
-                "light_fps": settings["light_output_fps"],
-            }
-        else:
-            raise RuntimeError(f"Unhandled format: {format!r}")
+        try:
+            description, renderer, get_renderer_params = _RENDERERS[format]
+        except KeyError:
+            raise RuntimeError(f"Unhandled format: {format!r}") from None
+
+        log.info(f"Exporting show to {description}")
+        renderer_params = get_renderer_params(output_fps, light_output_fps)
 
         api.export(
             show_title=show_title,
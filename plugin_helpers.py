@@ -1,19 +1,36 @@
 
 
 from contextlib import contextmanager
-from typing import ContextManager, Set, Type
+from typing import ContextManager, Dict, Set, Type
 
 import bpy
 import re
 
 
+_MENU_NAME_SANITIZER = re.compile(r"[^A-Za-z]+")
+"""Regular expression matching the characters of a menu name that need to be
+replaced with underscores to get the name of the corresponding menu type.
+"""
+
+_menu_types_by_name: Dict[str, Type] = {}
+"""Cache of menu types resolved by _get_menu_by_name()"""
+
+
 def _get_menu_by_name(menu):
-    menu = re.sub(r"[^A-Za-z]+", "_", menu.lower())
-    if hasattr(bpy.types, "TOPBAR_MT_" + menu):
-        return getattr(bpy.types, "TOPBAR_MT_" + menu)
-    else:
-        return getattr(bpy.types, "INFO_MT_" + menu)
+    result = _menu_types_by_name.get(menu)
+    if result is None:
+        name = _MENU_NAME_SANITIZER.sub("_", menu.lower())
+        result = getattr(bpy.types, "TOPBAR_MT_" + name, None)
+        if result is None:
+            result = getattr(bpy.types, "INFO_MT_" + name)
+        _menu_types_by_name[menu] = result
+    return result
+
 
+try:
+    from bpy.props import _PropertyDeferred as _PropertyType
+except ImportError:
+    _PropertyType = tuple
 
 _already_processed_with_make_annotations: Set[Type] = set()
 
@@ -23,25 +40,23 @@ def _make_annotations(cls):
     
     
     
-    try:
-        from bpy.props import _PropertyDeferred as PropertyType
-    except ImportError:
-        PropertyType = tuple
-
-    classes = list(reversed(cls.__mro__))
-    bl_props = {}
-    while classes:
-        current_class = classes.pop()
+    
+    
+    
+    for current_class in reversed(cls.__mro__):
         if (
-            current_class != cls
-            and current_class not in _already_processed_with_make_annotations
+            current_class is cls
+            or current_class not in _already_processed_with_make_annotations
         ):
-            _make_annotations(current_class)
+            _move_properties_to_annotations(current_class, _PropertyType)
+            _already_processed_with_make_annotations.add(current_class)
+
+    return cls
+
 
-    _already_processed_with_make_annotations.add(cls)
-    bl_props.update(
-        {k: v for k, v in cls.__dict__.items() if isinstance(v, PropertyType)}
-    )
+def _move_properties_to_annotations(cls, property_type) -> None:
+    
+    bl_props = {k: v for k, v in cls.__dict__.items() if isinstance(v, property_type)}
 
     if bl_props:
         if "__annotations__" not in cls.__dict__:
@@ -51,8 +66,6 @@ def _make_annotations(cls):
             annotations[k] = v
             delattr(cls, k)
 
-    return cls
-
 
 def register_in_menu(menu, func):
     _get_menu_by_name(menu).append(func)
@@ -146,6 +159,17 @@ def enter_edit_mode(obj=None, *, context=None):
     bpy.ops.object.mode_set(mode="EDIT", toggle=False)
 
 
+def exit_edit_mode(*, context=None):
+    
+    context = context or bpy.context
+    if context.mode != "EDIT_MESH":
+        return None
+
+    ob = context.view_layer.objects.active
+    bpy.ops.object.mode_set(mode="OBJECT", toggle=False)
+    return ob
+
+
 def is_online_access_allowed() -> bool:
     
     
@@ -1,7 +1,9 @@
 import bpy
 
-from bpy.types import Collection, Context
-from typing import Optional
+from bpy.types import Collection, Context, MeshVertex, Object
+from numpy import flatnonzero, zeros
+from numpy.typing import NDArray
+from typing import List, Optional
 
 from .constants import Collections
 from .objects import get_vertices_of_object
@@ -58,10 +60,10 @@ def get_selected_objects_from_collection(
     collection, *, context: Optional[Context] = None
 ):
     
-    result = [obj for obj in collection.objects if obj.select_get()]
-    selection = get_selected_objects(context=context)
-    result.sort(key=selection.index)
-    return result
+    
+    
+    members = set(collection.objects)
+    return [obj for obj in get_selected_objects(context=context) if obj in members]
 
 
 @with_context
@@ -81,7 +83,7 @@ def get_selected_vertices(*, context: Optional[Context] = None):
         with use_mode_for_object("OBJECT"):
             pass
 
-        vertices = [v for v in get_vertices_of_object(obj) if v.select]
+        vertices = _get_selected_vertices_of_object(obj)
 
     return vertices
 
@@ -101,7 +103,7 @@ def get_selected_vertices_grouped_by_objects(*, context: Optional[Context] = Non
         with use_mode_for_object("OBJECT"):
             pass
 
-        return {obj: [v for v in get_vertices_of_object(obj) if v.select]}
+        return {obj: _get_selected_vertices_of_object(obj)}
 
     else:
         return {}
@@ -116,7 +118,7 @@ def has_selection(*, context: Optional[Context] = None) -> bool:
         obj = context.active_object
         with use_mode_for_object("OBJECT"):
             pass
-        return any(v.select for v in get_vertices_of_object(obj))
+        return bool(_get_vertex_selection_mask_of_object(obj).any())
     else:
         return len(context.selected_objects) > 0
 
@@ -152,18 +154,48 @@ def ensure_vertex_select_mode_enabled(
         context.tool_settings.mesh_select_mode = msm
 
 
+def _get_vertex_selection_mask_of_object(obj: Optional[Object]) -> NDArray:
+    
+    vertices = get_vertices_of_object(obj)
+    mask = zeros(len(vertices), dtype=bool)
+    if len(mask):
+        
+        
+        vertices.foreach_get("select", mask)
+    return mask
+
+
+def _get_selected_vertices_of_object(obj: Optional[Object]) -> List[MeshVertex]:
+    
+    mask = _get_vertex_selection_mask_of_object(obj)
+    if not mask.any():
+        return []
+
+    vertices = get_vertices_of_object(obj)
+    return [vertices[index] for index in flatnonzero(mask).tolist()]
+
+
 def _set_selected_state_of_objects(objects, state, *, context: Context):
     
     if not hasattr(objects, "__iter__"):
         objects = [objects]
 
     queue = list(objects)
+    visited_collections = set()
     while queue:
         item = queue.pop()
-        if hasattr(item, "select_set"):
+        if isinstance(item, Object):
             item.select_set(state)
-        elif hasattr(item, "select"):
+        elif isinstance(item, MeshVertex):
             item.select = state
         elif isinstance(item, Collection):
-            queue.extend(item.objects)
-            queue.extend(item.children)
+            
+            
+            if item not in visited_collections:
+                visited_collections.add(item)
+                queue.extend(item.objects)
+                queue.extend(item.children)
+        elif hasattr(item, "select_set"):
+            item.select_set(state)
+        elif hasattr(item, "select"):
+            item.select = state
@@ -84,8 +84,9 @@ def _save(key: str, state: StateBase) -> None:
     data = json.dumps(state.to_json())
 
     key = "." + create_internal_id(key)
-    block, _ = ensure_object_exists_in_collection(bpy.data.texts, key)
-    block.from_string(data)
+    block, is_new = ensure_object_exists_in_collection(bpy.data.texts, key)
+    if is_new or block.as_string() != data:
+        block.from_string(data)
 
 
 @persistent
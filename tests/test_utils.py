@@ -0,0 +1,38 @@
+from sbstudio.utils import LRUCache
+
+
+def test_lru_cache_iteration_keeps_order():
+    cache = LRUCache(3)
+    cache["a"] = 1
+    cache["b"] = 2
+    cache["c"] = 3
+
+    assert list(cache.items()) == [("a", 1), ("b", 2), ("c", 3)]
+    assert list(cache.values()) == [1, 2, 3]
+    assert dict(cache) == {"a": 1, "b": 2, "c": 3}
+    assert cache == {"a": 1, "b": 2, "c": 3}
+    assert list(cache) == ["a", "b", "c"]
+
+
+def test_lru_cache_subscript_does_not_update_recency():
+    cache = LRUCache(2)
+    cache["a"] = 1
+    cache["b"] = 2
+
+    assert cache["a"] == 1
+    cache["c"] = 3
+
+    assert "a" not in cache
+    assert list(cache.items()) == [("b", 2), ("c", 3)]
+
+
+def test_lru_cache_get_updates_recency():
+    cache = LRUCache(2)
+    cache["a"] = 1
+    cache["b"] = 2
+
+    assert cache.get("a") == 1
+    cache["c"] = 3
+
+    assert "b" not in cache
+    assert list(cache.items()) == [("a", 1), ("c", 3)]
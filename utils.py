@@ -1,10 +1,12 @@
 import importlib.util
 
-from collections import OrderedDict
-from collections.abc import Callable, Iterable, MutableMapping, Sequence
+from collections.abc import Callable, MutableMapping, Sequence
 from functools import wraps
 from pathlib import Path
-from typing import Any, Generic, Optional, TypeVar
+from typing import Any, Generic, TypeVar
+
+from numpy import asarray, float64
+from numpy.typing import ArrayLike, NDArray
 
 from sbstudio.model.types import Coordinate3D
 
@@ -13,6 +15,7 @@ __all__ = (
     "constant",
     "create_path_and_open",
     "distance_sq_of",
+    "distances_sq_of",
     "simplify_path",
 )
 
@@ -42,21 +45,11 @@ def distance_sq_of(p: Coordinate3D, q: Coordinate3D) -> float:
     return (p[0] - q[0]) ** 2 + (p[1] - q[1]) ** 2 + (p[2] - q[2]) ** 2
 
 
-def get_ends(items: Optional[Iterable[T]]) -> tuple[T, T] | None:
+def distances_sq_of(points: ArrayLike, q: Coordinate3D) -> NDArray:
     
-    if items is None:
-        return None
-
-    iterator = iter(items)
-    try:
-        first = last = next(iterator)
-    except StopIteration:
-        return None
-
-    for item in iterator:
-        last = item
-
-    return (first, last)
+    diffs = asarray(points, dtype=float64).reshape(-1, 3) - asarray(q, dtype=float64)
+    diffs *= diffs
+    return diffs.sum(axis=1)
 
 
 def negate(func: Callable[..., bool]) -> Callable[..., bool]:
@@ -83,17 +76,28 @@ def simplify_path(
 
 
 def _simplify_line(points, *, eps, distance_func):
-    start, end = points[0], points[-1]
-    dists = distance_func(points, start, end)
-    index = max(range(len(dists)), key=dists.__getitem__)
-    dmax = dists[index]
+    
+    
+    
+    
+    
+    result = []
+    stack = [(0, len(points) - 1)]
+    while stack:
+        lo, hi = stack.pop()
+        start, end = points[lo], points[hi]
+        dists = distance_func(points[lo : hi + 1], start, end)
+        index = max(range(len(dists)), key=dists.__getitem__)
+
+        if dists[index] <= eps or index == 0 or lo + index == hi:
+            if not result:
+                result.append(start)
+            result.append(end)
+        else:
+            stack.append((lo + index, hi))
+            stack.append((lo, lo + index))
 
-    if dmax <= eps:
-        return [start, end]
-    else:
-        pre = _simplify_line(points[: index + 1], eps=eps, distance_func=distance_func)
-        post = _simplify_line(points[index:], eps=eps, distance_func=distance_func)
-        return pre[:-1] + post
+    return result
 
 
 def load_module(path: str) -> Any:
@@ -107,13 +111,18 @@ def load_module(path: str) -> Any:
 class LRUCache(Generic[K, V], MutableMapping[K, V]):
     
 
-    _items: OrderedDict[K, V]
+    _items: dict[K, V]
 
     def __init__(self, capacity: int):
         
-        self._items = OrderedDict()
+        
+        
+        self._items = {}
         self._capacity = max(int(capacity), 1)
 
+    def __contains__(self, key: object) -> bool:
+        return key in self._items
+
     def __delitem__(self, key: K) -> None:
         del self._items[key]
 
@@ -124,15 +133,17 @@ class LRUCache(Generic[K, V], MutableMapping[K, V]):
         return len(self._items)
 
     def __setitem__(self, key: K, value: V):
-        self._items[key] = value
-        self._items.move_to_end(key)
-        if len(self._items) > self._capacity:
-            self._items.popitem(last=False)
+        items = self._items
+        items.pop(key, None)
+        items[key] = value
+        if len(items) > self._capacity:
+            del items[next(iter(items))]
 
     def get(self, key: K) -> V:
         
-        value = self._items[key]
-        self._items.move_to_end(key)
+        items = self._items
+        value = items.pop(key)
+        items[key] = value
         return value
 
     def peek(self, key: K) -> V:
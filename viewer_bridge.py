@@ -1,6 +1,7 @@
 
 
 from datetime import datetime
+from email.parser import BytesHeaderParser
 from email.utils import parsedate_to_datetime
 from errno import ECONNREFUSED, ENETUNREACH
 from json import load
@@ -128,6 +129,26 @@ class SkybrushViewerBridge:
             raise SkybrushViewerError("Invalid response received from Skybrush Viewer")
 
 
+_SSDP_OK_STATUS_LINE = b"HTTP/1.1 200 OK\r\n"
+"""Status line that starts a successful SSDP search response."""
+
+_ssdp_header_parser = BytesHeaderParser()
+
+
+def _is_close_to_current_time(value: str) -> bool:
+    try:
+        parsed_date = parsedate_to_datetime(value)
+    except ValueError:
+        return False
+
+    if parsed_date.tzinfo is None or parsed_date.tzinfo.utcoffset(parsed_date) is None:
+        diff = parsed_date - datetime.now()
+    else:
+        diff = parsed_date - datetime.now(parsed_date.tzinfo)
+
+    return abs(diff.total_seconds()) < 5
+
+
 class SSDPAppDiscovery:
     
 
@@ -135,6 +156,7 @@ class SSDPAppDiscovery:
         
         self._sock = socket(AF_INET, SOCK_DGRAM, IPPROTO_UDP)
         self._sock.settimeout(1)
+        self._recv_buffer = memoryview(bytearray(65507))
 
         self._urn = urn
         self._max_age = float(max_age)
@@ -187,7 +209,6 @@ class SSDPAppDiscovery:
         location = None
         while attempts > 0:
             attempts -= 1
-            date_ok = False
             location = None
 
             try:
@@ -195,37 +216,21 @@ class SSDPAppDiscovery:
                 
                 
                 
-                data, addr = self._sock.recvfrom(65507)
+                num_bytes, _ = self._sock.recvfrom_into(self._recv_buffer)
             except SocketTimeoutError:
                 return
 
-            if not data.startswith(b"HTTP/1.1 200 OK\r\n"):
+            data = self._recv_buffer[:num_bytes]
+            status_length = len(_SSDP_OK_STATUS_LINE)
+            if data[:status_length] != _SSDP_OK_STATUS_LINE:
                 continue
 
-            lines = data.split(b"\r\n")
-            for line in lines:
-                key, _, value = line.partition(b":")
-                key = key.decode("ascii", "replace").upper().strip()
-                if key == "LOCATION":
-                    location = value.decode("ascii", "replace").strip()
-                elif key == "DATE":
-                    try:
-                        parsed_date = parsedate_to_datetime(
-                            value.decode("ascii", "replace")
-                        )
-                    except ValueError:
-                        continue
-
-                    if (
-                        parsed_date.tzinfo is None
-                        or parsed_date.tzinfo.utcoffset(parsed_date) is None
-                    ):
-                        diff = parsed_date - datetime.now()
-                    else:
-                        diff = parsed_date - datetime.now(parsed_date.tzinfo)
-
-                    if abs(diff.total_seconds()) < 5:
-                        date_ok = True
+            headers = _ssdp_header_parser.parsebytes(data[status_length:].tobytes())
+            location = headers.get("LOCATION")
+            if location is not None:
+                location = str(location).strip()
+            date = headers.get("DATE")
+            date_ok = date is not None and _is_close_to_current_time(str(date))
 
             if location and date_ok:
                 break
@@ -19,8 +19,7 @@ __all__ = (
 @with_screen
 def find_all_3d_views(screen: Optional[str] = None) -> Iterable[SpaceView3D]:
     
-    for space, _area in _find_all_3d_views_and_their_areas(screen):
-        yield space
+    return [space for space, _area in _find_all_3d_views_and_their_areas(screen)]
 
 
 @with_screen
@@ -35,11 +34,13 @@ def find_all_3d_views_and_their_areas(
 def _find_all_3d_views_and_their_areas(
     screen: Optional[str] = None,
 ) -> Iterable[Tuple[SpaceView3D, Area]]:
-    for area in screen.areas:  
-        if area.type == "VIEW_3D":
-            for space in area.spaces:
-                if space.type == "VIEW_3D":
-                    yield space, area
+    return [
+        (space, area)
+        for area in screen.areas  
+        if area.type == "VIEW_3D"
+        for space in area.spaces
+        if space.type == "VIEW_3D"
+    ]
 
 
 @with_screen